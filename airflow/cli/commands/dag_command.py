@@ -325,14 +325,18 @@ def _save_dot_to_file(dot: Dot, filename: str) -> None:
     print(f"File {filename} saved")
 
 
-def _get_dagbag_dag_details(dag: DAG) -> dict:
+@provide_session
+def _get_dagbag_dag_details(dag: DAG, session: Session = NEW_SESSION) -> dict:
     """Return a dagbag dag details dict."""
+    is_paused, is_active = session.execute(
+        select(DagModel.is_paused, DagModel.is_active).where(DagModel.dag_id == dag.dag_id)
+    ).one_or_none() or (None, None)
     return {
         "dag_id": dag.dag_id,
         "dag_display_name": dag.dag_display_name,
         "root_dag_id": dag.parent_dag.dag_id if dag.parent_dag else None,
-        "is_paused": dag.get_is_paused(),
-        "is_active": dag.get_is_active(),
+        "is_paused": is_paused,
+        "is_active": is_active,
         "is_subdag": dag.is_subdag,
         "last_parsed_time": None,
         "last_pickled": None,
@@ -456,7 +460,7 @@ def dag_list_dags(args, session=NEW_SESSION) -> None:
         if dag_model:
             dag_detail = dag_schema.dump(dag_model)
         else:
-            dag_detail = _get_dagbag_dag_details(dag)
+            dag_detail = _get_dagbag_dag_details(dag, session=session)
         return {col: dag_detail[col] for col in valid_cols}
 
     AirflowConsole().print_as(
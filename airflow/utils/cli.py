@@ -257,7 +257,8 @@ def get_dags(subdir: str | None, dag_id: str, use_regex: bool = False):
     if not use_regex:
         return [get_dag(subdir, dag_id)]
     dagbag = DagBag(process_subdir(subdir))
-    matched_dags = [dag for dag in dagbag.dags.values() if re2.search(dag_id, dag.dag_id)]
+    dag_id_pattern = re2.compile(dag_id)
+    matched_dags = [dag for dag in dagbag.dags.values() if dag_id_pattern.search(dag.dag_id)]
     if not matched_dags:
         raise AirflowException(
             f"dag_id could not be found with regex: {dag_id}. Either the dag did not exist or "
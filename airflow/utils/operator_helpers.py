@@ -17,11 +17,16 @@
 # under the License.
 from __future__ import annotations
 
+import inspect
 import logging
+import operator
+import types
+import weakref
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Collection, Mapping, TypeVar
 
 from airflow import settings
+from airflow.datasets.metadata import Metadata
 from airflow.utils.context import Context, lazy_mapping_from_context
 
 if TYPE_CHECKING:
@@ -63,6 +68,55 @@ AIRFLOW_VAR_NAME_FORMAT_MAPPING = {
     },
 }
 
+# Attributes read by context_to_airflow_vars, as (subject, attribute, mapping key).
+# The subject is an index into (task, task_instance, dag_run). The per-format tables
+# below hold a prebuilt attrgetter and the resolved output name for each entry.
+_CONTEXT_VAR_OPS = (
+    (0, "email", "AIRFLOW_CONTEXT_DAG_EMAIL"),
+    (0, "owner", "AIRFLOW_CONTEXT_DAG_OWNER"),
+    (1, "dag_id", "AIRFLOW_CONTEXT_DAG_ID"),
+    (1, "task_id", "AIRFLOW_CONTEXT_TASK_ID"),
+    (1, "execution_date", "AIRFLOW_CONTEXT_EXECUTION_DATE"),
+    (1, "try_number", "AIRFLOW_CONTEXT_TRY_NUMBER"),
+    (2, "run_id", "AIRFLOW_CONTEXT_DAG_RUN_ID"),
+)
+_DEFAULT_FORMAT_OPS = tuple(
+    (subject, operator.attrgetter(attr), AIRFLOW_VAR_NAME_FORMAT_MAPPING[mapping_key]["default"])
+    for subject, attr, mapping_key in _CONTEXT_VAR_OPS
+)
+_ENV_VAR_FORMAT_OPS = tuple(
+    (subject, operator.attrgetter(attr), AIRFLOW_VAR_NAME_FORMAT_MAPPING[mapping_key]["env_var_format"])
+    for subject, attr, mapping_key in _CONTEXT_VAR_OPS
+)
+
+
+def _str_identity(value: str) -> str:
+    return value
+
+
+_isoformat = operator.methodcaller("isoformat")
+
+# Converters turning context attribute values into strings, in isinstance order.
+# Values of any other type are converted with str().
+_ATTR_CONVERTER_BASES: tuple[tuple[type, Callable[[Any], str]], ...] = (
+    (str, _str_identity),
+    (datetime, _isoformat),
+    # os env variable value needs to be string
+    (list, ",".join),
+)
+
+# Converters keyed by exact type. Subclasses of the types above are added on first use.
+_ATTR_CONVERTERS: dict[type, Callable[[Any], str]] = dict(_ATTR_CONVERTER_BASES)
+
+
+def _get_attr_converter(attr_type: type) -> Callable[[Any], str]:
+    for base, converter in _ATTR_CONVERTER_BASES:
+        if issubclass(attr_type, base):
+            _ATTR_CONVERTERS[attr_type] = converter
+            return converter
+    # Not memoized, so arbitrary types (e.g. per-instance mock classes) don't accumulate.
+    return str
+
 
 def context_to_airflow_vars(context: Mapping[str, Any], in_env_var_format: bool = False) -> dict[str, str]:
     """
@@ -78,54 +132,103 @@ def context_to_airflow_vars(context: Mapping[str, Any], in_env_var_format: bool
     :return: task_instance context as dict.
     """
     params = {}
-    if in_env_var_format:
-        name_format = "env_var_format"
-    else:
-        name_format = "default"
-
-    task = context.get("task")
-    task_instance = context.get("task_instance")
-    dag_run = context.get("dag_run")
-
-    ops = [
-        (task, "email", "AIRFLOW_CONTEXT_DAG_EMAIL"),
-        (task, "owner", "AIRFLOW_CONTEXT_DAG_OWNER"),
-        (task_instance, "dag_id", "AIRFLOW_CONTEXT_DAG_ID"),
-        (task_instance, "task_id", "AIRFLOW_CONTEXT_TASK_ID"),
-        (task_instance, "execution_date", "AIRFLOW_CONTEXT_EXECUTION_DATE"),
-        (task_instance, "try_number", "AIRFLOW_CONTEXT_TRY_NUMBER"),
-        (dag_run, "run_id", "AIRFLOW_CONTEXT_DAG_RUN_ID"),
-    ]
+    subjects = (context.get("task"), context.get("task_instance"), context.get("dag_run"))
+    ops = _ENV_VAR_FORMAT_OPS if in_env_var_format else _DEFAULT_FORMAT_OPS
 
     context_params = settings.get_airflow_context_vars(context)
-    for key, value in context_params.items():
-        if not isinstance(key, str):
-            raise TypeError(f"key <{key}> must be string")
-        if not isinstance(value, str):
-            raise TypeError(f"value of key <{key}> must be string, not {type(value)}")
-
-        if in_env_var_format:
-            if not key.startswith(ENV_VAR_FORMAT_PREFIX):
-                key = ENV_VAR_FORMAT_PREFIX + key.upper()
-        else:
-            if not key.startswith(DEFAULT_FORMAT_PREFIX):
-                key = DEFAULT_FORMAT_PREFIX + key
-        params[key] = value
-
-    for subject, attr, mapping_key in ops:
-        _attr = getattr(subject, attr, None)
-        if subject and _attr:
-            mapping_value = AIRFLOW_VAR_NAME_FORMAT_MAPPING[mapping_key][name_format]
-            if isinstance(_attr, str):
-                params[mapping_value] = _attr
-            elif isinstance(_attr, datetime):
-                params[mapping_value] = _attr.isoformat()
-            elif isinstance(_attr, list):
-                # os env variable value needs to be string
-                params[mapping_value] = ",".join(_attr)
-            else:
-                params[mapping_value] = str(_attr)
+    if context_params:
+        prefix = ENV_VAR_FORMAT_PREFIX if in_env_var_format else DEFAULT_FORMAT_PREFIX
+        for key, value in context_params.items():
+            if not isinstance(key, str):
+                raise TypeError(f"key <{key}> must be string")
+            if not isinstance(value, str):
+                raise TypeError(f"value of key <{key}> must be string, not {type(value)}")
+
+            if not key.startswith(prefix):
+                key = prefix + (key.upper() if in_env_var_format else key)
+            params[key] = value
+
+    for subject_index, get_attr, mapping_value in ops:
+        subject = subjects[subject_index]
+        if subject is None:
+            continue
+        try:
+            _attr = get_attr(subject)
+        except AttributeError:
+            continue
+        if _attr:
+            converter = _ATTR_CONVERTERS.get(type(_attr)) or _get_attr_converter(type(_attr))
+            params[mapping_value] = converter(_attr)
+
+    return params
+
+
+def _get_code_params(func: Callable[..., Any]) -> tuple[bool, tuple[str, ...]] | None:
+    """
+    Read the parameters of a plain Python function directly from its code object.
+
+    This gives the same result as ``inspect.signature`` without building any
+    ``Parameter`` objects. ``None`` is returned for anything that is not a plain
+    function (bound methods, partials, builtins, objects with ``__signature__``),
+    so the caller can fall back to the full signature machinery.
+    """
+    func = inspect.unwrap(func, stop=lambda f: hasattr(f, "__signature__") or inspect.ismethod(f))
+    if not isinstance(func, types.FunctionType) or hasattr(func, "__signature__"):
+        return None
+    code = func.__code__
+    pos_count = code.co_argcount
+    kw_only_end = pos_count + code.co_kwonlyargcount
+    param_names = code.co_varnames[:pos_count]
+    if code.co_flags & inspect.CO_VARARGS:
+        param_names += (code.co_varnames[kw_only_end],)
+        var_keyword_index = kw_only_end + 1
+    else:
+        var_keyword_index = kw_only_end
+    param_names += code.co_varnames[pos_count:kw_only_end]
+    has_wildcard_kwargs = bool(code.co_flags & inspect.CO_VARKEYWORDS)
+    if has_wildcard_kwargs:
+        param_names += (code.co_varnames[var_keyword_index],)
+    return has_wildcard_kwargs, param_names
+
+
+def _inspect_callable_params(func: Callable[..., Any]) -> tuple[bool, tuple[str, ...]]:
+    """Return whether a callable accepts ``**kwargs``, and its parameter names in order."""
+    code_params = _get_code_params(func)
+    if code_params is not None:
+        has_wildcard_kwargs, param_names = code_params
+    else:
+        signature = inspect.signature(func)
+        has_wildcard_kwargs = any(p.kind == p.VAR_KEYWORD for p in signature.parameters.values())
+        param_names = tuple(signature.parameters)
+    return has_wildcard_kwargs, param_names
+
 
+# Inspection results per callable. Keys are held weakly so a cached callable never keeps
+# its owner (e.g. an operator copy) alive. Bound methods are keyed on their underlying
+# function, since their signature does not depend on the instance they are bound to.
+_function_params_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_method_params_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_callable_params(func: Callable[..., Any]) -> tuple[bool, tuple[str, ...]]:
+    """
+    Return the cached result of ``_inspect_callable_params`` for a callable.
+
+    Building a signature is expensive, and the same callables are inspected again
+    for every task run, so the result is cached per callable.
+    """
+    if inspect.ismethod(func):
+        cache, key = _method_params_cache, func.__func__
+    else:
+        cache, key = _function_params_cache, func
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable or not weak-referenceable; inspect it on every call.
+        return _inspect_callable_params(func)
+    params = cache[key] = _inspect_callable_params(func)
     return params
 
 
@@ -155,13 +258,13 @@ class KeywordParameters:
         args: Collection[Any],
         kwargs: Mapping[str, Any],
     ) -> KeywordParameters:
-        import inspect
-        import itertools
+        if not kwargs:
+            # Nothing to filter, and nothing for args to conflict with.
+            return cls(kwargs, wildcard=False)
 
-        signature = inspect.signature(func)
-        has_wildcard_kwargs = any(p.kind == p.VAR_KEYWORD for p in signature.parameters.values())
+        has_wildcard_kwargs, param_names = _get_callable_params(func)
 
-        for name in itertools.islice(signature.parameters.keys(), len(args)):
+        for name in param_names[: len(args)]:
             # Check if args conflict with names in kwargs.
             if name in kwargs:
                 raise ValueError(f"The key {name!r} in args is a part of kwargs and therefore reserved.")
@@ -171,7 +274,7 @@ class KeywordParameters:
             return cls(kwargs, wildcard=True)
 
         # If the callable has no **kwargs argument, it only wants the arguments it requested.
-        kwargs = {key: kwargs[key] for key in signature.parameters if key in kwargs}
+        kwargs = {key: kwargs[key] for key in param_names if key in kwargs}
         return cls(kwargs, wildcard=False)
 
     def unpacking(self) -> Mapping[str, Any]:
@@ -198,6 +301,8 @@ def determine_kwargs(
     :param kwargs: The keyword arguments that need to be filtered before passing to the callable.
     :return: A dictionary which contains the keyword arguments that are compatible with the callable.
     """
+    if not kwargs:
+        return kwargs
     return KeywordParameters.determine(func, args, kwargs).unpacking()
 
 
@@ -207,14 +312,21 @@ def make_kwargs_callable(func: Callable[..., R]) -> Callable[..., R]:
 
     Make a new callable that can accept any number of positional or keyword arguments
     but only forwards those required by the given callable func.
+
+    The signature of func is inspected once here rather than on every call. If func
+    accepts ``**kwargs`` it is returned as-is, since there is nothing to filter.
     """
-    import functools
+    has_wildcard_kwargs, param_names = _get_callable_params(func)
+    if has_wildcard_kwargs:
+        return func
 
-    @functools.wraps(func)
     def kwargs_func(*args, **kwargs):
-        kwargs = determine_kwargs(func, args, kwargs)
-        return func(*args, **kwargs)
+        return func(*args, **{key: kwargs[key] for key in param_names if key in kwargs})
 
+    # Only copy the metadata Airflow looks at; functools.wraps also copies __dict__ etc.
+    kwargs_func.__wrapped__ = func  # type: ignore[attr-defined]
+    kwargs_func.__name__ = getattr(func, "__name__", kwargs_func.__name__)
+    kwargs_func.__doc__ = func.__doc__
     return kwargs_func
 
 
@@ -239,28 +351,22 @@ class ExecutionCallableRunner:
         self.func = func
         self.outlet_events = outlet_events
         self.logger = logger or logging.getLogger(__name__)
+        self._is_generator = inspect.isgeneratorfunction(func)
 
     def run(self, *args, **kwargs) -> Any:
-        import inspect
-
-        from airflow.datasets.metadata import Metadata
-        from airflow.utils.types import NOTSET
-
-        if not inspect.isgeneratorfunction(self.func):
+        if not self._is_generator:
             return self.func(*args, **kwargs)
 
-        result: Any = NOTSET
-
-        def _run():
-            nonlocal result
-            result = yield from self.func(*args, **kwargs)
-
-        for metadata in _run():
+        gen = self.func(*args, **kwargs)
+        while True:
+            try:
+                metadata = next(gen)
+            except StopIteration as e:
+                # The generator's return value is the task's result.
+                return e.value
             if isinstance(metadata, Metadata):
                 self.outlet_events[metadata.uri].extra.update(metadata.extra)
                 continue
             self.logger.warning("Ignoring unknown data of %r received from task", type(metadata))
             if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug("Full yielded value: %r", metadata)
-
-        return result